@@ -12,15 +12,27 @@ Functions are designed to be called independently for different use cases.
 """
 
 import os
-from typing import Optional, Tuple, List
+import re
+import gc
+import shutil
+import struct
+import hashlib
+import inspect
+import functools
+import itertools
+import contextlib
+import threading
+from typing import Optional, Tuple, List, Iterable, Iterator, Callable
 import tempfile
+from io import BytesIO
 from pathlib import Path
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # Core dependencies
 import fitz  # PyMuPDF for PDF processing
 import numpy as np
 import soundfile as sf
-import librosa
 
 # TTS dependencies
 try:
@@ -29,38 +41,142 @@ except ImportError:
     print("Warning: gTTS not installed. Install with: pip install gtts")
     gTTS = None
 
-try:
-    from TTS.api import TTS
-except ImportError:
-    print("Warning: TTS not installed. Install with: pip install TTS")
-    TTS = None
+# Voice cloning / audio processing dependencies. Importing these pulls in
+# torch and CUDA libraries (seconds of start-up), so they are only loaded
+# by load_voice_dependencies() and the gTTS path never pays for them.
+TTS = None
+torch = None
+librosa = None
+nr = None
+NOISE_REDUCTION_AVAILABLE = False
+SCIPY_AVAILABLE = False
+NUMBA_AVAILABLE = False
+_VOICE_DEPENDENCIES_LOADED = False
+_VOICE_DEPENDENCIES_LOCK = threading.Lock()
 
-# Optional noise reduction dependencies
-try:
-    import noisereduce as nr
-    NOISE_REDUCTION_AVAILABLE = True
-except ImportError:
-    print("Info: noisereduce not available. Install with: pip install noisereduce")
-    NOISE_REDUCTION_AVAILABLE = False
 
-try:
-    from scipy.signal import butter, filtfilt
-    SCIPY_AVAILABLE = True
-except ImportError:
-    print("Warning: scipy not available for advanced filtering")
-    SCIPY_AVAILABLE = False
+def load_voice_dependencies() -> None:
+    """
+    Import the voice cloning and voice cleaning dependencies on first use.
+    
+    Safe to call repeatedly; every call after the first returns immediately.
+    """
+    global TTS, torch, librosa, nr, butter, sosfiltfilt, firwin, oaconvolve
+    global NOISE_REDUCTION_AVAILABLE, SCIPY_AVAILABLE, NUMBA_AVAILABLE
+    global _VOICE_DEPENDENCIES_LOADED, _find_trim_bounds
+    
+    with _VOICE_DEPENDENCIES_LOCK:
+        if _VOICE_DEPENDENCIES_LOADED:
+            return
+        
+        import librosa
+        
+        try:
+            from TTS.api import TTS
+        except ImportError:
+            print("Warning: TTS not installed. Install with: pip install TTS")
+            TTS = None
+        
+        try:
+            import torch
+        except ImportError:
+            torch = None
+        
+        # Optional noise reduction dependencies
+        try:
+            import noisereduce as nr
+            NOISE_REDUCTION_AVAILABLE = True
+        except ImportError:
+            print("Info: noisereduce not available. Install with: pip install noisereduce")
+            NOISE_REDUCTION_AVAILABLE = False
+        
+        try:
+            from scipy.signal import butter, sosfiltfilt, firwin, oaconvolve
+            SCIPY_AVAILABLE = True
+        except ImportError:
+            print("Warning: scipy not available for advanced filtering")
+            SCIPY_AVAILABLE = False
+        
+        try:
+            from numba import njit
+            _find_trim_bounds = njit(cache=True)(_find_trim_bounds)
+            NUMBA_AVAILABLE = True
+        except ImportError:
+            print("Info: numba not available, using librosa for silence trimming. Install with: pip install numba")
+            NUMBA_AVAILABLE = False
+        
+        _VOICE_DEPENDENCIES_LOADED = True
 
 
-def extract_text_from_pdf(pdf_path: str, page_range: Optional[Tuple[int, int]] = None) -> List[str]:
+# Parallel synthesis settings
+GTTS_MAX_WORKERS = 8  # Concurrent gTTS HTTPS requests
+FADE_DURATION = 0.002  # Seconds of fade-in/out applied at chunk boundaries
+LONG_SAMPLE_SECONDS = 60  # Voice samples longer than this are filtered with overlap-add FFT
+FIR_NUM_TAPS = 513  # Linear-phase FIR length for the overlap-add path
+CLEAN_SAMPLE_THRESHOLD_DB = 25.0  # Samples above this peak-to-RMS ratio skip cleaning
+VOICE_SAMPLE_RATE = 16000  # Rate the YourTTS speaker encoder works at
+PCM_WRITE_BLOCK = 1 << 19  # Samples per write block (1 MiB of 16-bit PCM)
+DEFAULT_VOICE_MODEL = "tts_models/multilingual/multi-dataset/your_tts"
+COQUI_BATCH_SIZE = 8  # Sentences per batched Coqui forward pass
+COQUI_SORT_WINDOW = 4 * COQUI_BATCH_SIZE  # Largest group of sentences regrouped by length before batching
+SENTENCE_PAUSE_SAMPLES = 10000  # Same pause Coqui's Synthesizer inserts after each sentence
+
+# Text extraction backend: "pymupdf" (default) or "rs" for the Rust-based pdfplumber-rs
+PDF_BACKEND = os.environ.get("TTS_PDF_BACKEND", "pymupdf").lower()
+
+# Synthesized audio is memoized on disk; set PDF_TTS_CACHE_DIR="" to disable
+AUDIO_CACHE_DIR = os.environ.get("PDF_TTS_CACHE_DIR", os.path.join(tempfile.gettempdir(), "pdf_tts_cache"))
+# Least recently used files are evicted once the cache exceeds this size
+AUDIO_CACHE_MAX_BYTES = int(os.environ.get("PDF_TTS_CACHE_MAX_MB", "512")) * (1 << 20)
+
+# Warm caches shared by every call (and Streamlit rerun) in this process
+_TTS_CACHE = {}
+_TTS_CACHE_LOCK = threading.Lock()
+_SPEAKER_EMBEDDING_CACHE = OrderedDict()
+_SPEAKER_EMBEDDING_CACHE_SIZE = 32
+
+
+@functools.lru_cache(maxsize=None)
+def _load_rust_pdf_backend():
+    """Return pdfplumber-rs's native PDF class if TTS_PDF_BACKEND selects it and it is installed."""
+    if PDF_BACKEND == "pymupdf":
+        return None
+    if PDF_BACKEND != "rs":
+        print(f"Warning: unknown TTS_PDF_BACKEND '{PDF_BACKEND}', using PyMuPDF")
+        return None
+    try:
+        # pdfplumber-rs installs as the `pdfplumber` module; only its native
+        # extension (not the pure-Python pdfplumber) has PDF.open_bytes
+        import pdfplumber
+    except ImportError:
+        pdfplumber = None
+    native_pdf = getattr(getattr(pdfplumber, "_native", None), "PDF", None)
+    if not hasattr(native_pdf, "open_bytes"):
+        print("Warning: pdfplumber-rs not installed, using PyMuPDF. Install with: pip install pdfplumber-rs")
+        return None
+    return native_pdf
+
+
+def _iter_text_rust(native_pdf, pdf_path: str, start_page: int, stop_page: int) -> Iterator[str]:
+    """Yield the non-empty page texts of pages [start, stop) using pdfplumber-rs."""
+    with open(pdf_path, 'rb') as f:
+        pdf = native_pdf.open_bytes(f.read())
+    for page in pdf.pages[start_page:stop_page]:
+        text = (page.extract_text() or "").strip()
+        if text:
+            yield text
+
+
+def iter_text_from_pdf(pdf_path: str, page_range: Optional[Tuple[int, int]] = None) -> Iterator[str]:
     """
-    Extract text from PDF file.
+    Lazily extract text from PDF file, one page at a time.
     
     Args:
         pdf_path (str): Path to the PDF file
         page_range (tuple, optional): (start_page, end_page) to extract specific pages
     
-    Returns:
-        List[str]: List of text content from each page
+    Yields:
+        str: Text content of each non-empty page, in page order
     
     Raises:
         FileNotFoundError: If PDF file doesn't exist
@@ -70,32 +186,187 @@ def extract_text_from_pdf(pdf_path: str, page_range: Optional[Tuple[int, int]] =
         raise FileNotFoundError(f"PDF file not found: {pdf_path}")
     
     try:
-        doc = fitz.open(pdf_path)
-        pages_text = []
-        
-        start_page = page_range[0] if page_range else 0
-        end_page = page_range[1] if page_range else len(doc) - 1
-        
-        for page_num in range(start_page, min(end_page + 1, len(doc))):
-            page = doc[page_num]
-            text = page.get_text().strip()
-            if text:  # Only add non-empty pages
-                pages_text.append(text)
-        
-        doc.close()
-        return pages_text
+        with fitz.open(pdf_path) as doc:
+            start_page = page_range[0] if page_range else 0
+            end_page = page_range[1] if page_range else doc.page_count - 1
+            start_page = max(start_page, 0)
+            stop_page = min(end_page + 1, doc.page_count)
+            
+            if start_page >= doc.page_count or stop_page <= start_page:
+                return  # Empty or out-of-range page_range: nothing to extract
+            
+            rust_backend = _load_rust_pdf_backend()
+            if rust_backend is not None:
+                yield from _iter_text_rust(rust_backend, pdf_path, start_page, stop_page)
+                return
+            
+            # Iterate only the requested pages; the generator stops after
+            # end_page instead of indexing page by page into the document.
+            # Extraction stays in-process: it runs at hundreds of pages per
+            # second, well under the startup cost of worker processes.
+            for page in doc.pages(start_page, stop_page):
+                text = page.get_text().strip()
+                if text:  # Only yield non-empty pages
+                    yield text
         
     except Exception as e:
         raise Exception(f"Error processing PDF: {str(e)}")
 
 
+def extract_text_from_pdf(pdf_path: str, page_range: Optional[Tuple[int, int]] = None) -> List[str]:
+    """
+    Extract text from PDF file.
+    
+    Args:
+        pdf_path (str): Path to the PDF file
+        page_range (tuple, optional): (start_page, end_page) to extract specific pages
+    
+    Returns:
+        List[str]: List of text content from each page
+    
+    Raises:
+        FileNotFoundError: If PDF file doesn't exist
+        Exception: If PDF cannot be processed
+    """
+    return list(iter_text_from_pdf(pdf_path, page_range))
+
+
+def _load_audio_mono(path: str) -> Tuple[np.ndarray, int]:
+    """Read an audio file as mono float32 at its native sample rate."""
+    try:
+        audio_data, sample_rate = sf.read(path, dtype='float32', always_2d=False)
+    except RuntimeError:
+        # Formats libsndfile cannot decode (e.g. MP3 on older builds)
+        return librosa.load(path, sr=None)
+    
+    if audio_data.ndim > 1:
+        audio_data = audio_data.mean(axis=1, dtype=np.float32)
+    return audio_data, sample_rate
+
+
+def _find_trim_bounds(audio_data, top_db, frame_length, hop_length):
+    """
+    Find the non-silent region of a signal, like librosa.effects.trim.
+    
+    Frame energies are computed with a running sum of squares, so the scan
+    is O(N) regardless of the frame length. Compiled with Numba when available.
+    
+    Returns:
+        Tuple[int, int]: (start, end) sample indices of the region to keep
+    """
+    n = audio_data.shape[0]
+    if n <= frame_length:
+        return 0, n
+    
+    n_frames = 1 + (n - frame_length) // hop_length
+    energies = np.empty(n_frames)
+    
+    energy = 0.0
+    for i in range(frame_length):
+        energy += audio_data[i] * audio_data[i]
+    energies[0] = energy
+    
+    for frame in range(1, n_frames):
+        start = (frame - 1) * hop_length
+        for i in range(start, start + hop_length):
+            energy -= audio_data[i] * audio_data[i]
+        for i in range(start + frame_length, start + frame_length + hop_length):
+            energy += audio_data[i] * audio_data[i]
+        energies[frame] = energy
+    
+    threshold = energies.max() * 10.0 ** (-top_db / 10.0)
+    if threshold <= 0.0:
+        return 0, n
+    
+    first = 0
+    while energies[first] <= threshold:
+        first += 1
+    last = n_frames - 1
+    while energies[last] <= threshold:
+        last -= 1
+    
+    return first * hop_length, min(n, last * hop_length + frame_length)
+
+
+def _find_trim_bounds_vectorized(audio_data: np.ndarray, top_db: float, frame_length: int, hop_length: int) -> Tuple[int, int]:
+    """
+    NumPy version of _find_trim_bounds for when Numba is not installed.
+    
+    Frame energies are differences of one cumulative sum of squares, and
+    the first/last loud frames come from argmax over a boolean mask, so
+    there is no Python-level loop over frames.
+    """
+    n = audio_data.shape[0]
+    if n <= frame_length:
+        return 0, n
+    
+    n_frames = 1 + (n - frame_length) // hop_length
+    cumulative = np.empty(n + 1)
+    cumulative[0] = 0.0
+    np.cumsum(np.square(audio_data, dtype=np.float64), out=cumulative[1:])
+    starts = np.arange(n_frames) * hop_length
+    energies = cumulative[starts + frame_length] - cumulative[starts]
+    
+    threshold = energies.max() * 10.0 ** (-top_db / 10.0)
+    if threshold <= 0.0:
+        return 0, n
+    
+    loud = energies > threshold
+    first = int(loud.argmax())
+    last = n_frames - 1 - int(loud[::-1].argmax())
+    return first * hop_length, min(n, last * hop_length + frame_length)
+
+
+def _to_pcm16(audio_data: np.ndarray) -> np.ndarray:
+    """Convert float audio in [-1, 1] to little-endian 16-bit PCM samples."""
+    return np.clip(audio_data * 32767, -32768, 32767).astype('<i2')
+
+
+def _write_pcm16(path: str, audio_data: np.ndarray, sample_rate: int) -> None:
+    """Write mono float audio as 16-bit PCM, converting one block at a time."""
+    with sf.SoundFile(path, 'w', samplerate=sample_rate, channels=1, subtype='PCM_16') as out:
+        for start in range(0, len(audio_data), PCM_WRITE_BLOCK):
+            out.write(_to_pcm16(audio_data[start:start + PCM_WRITE_BLOCK]))
+
+
+def _estimate_snr_db(audio_data: np.ndarray) -> float:
+    """Quick SNR estimate of a voice sample as its peak-to-RMS ratio in dB."""
+    if audio_data.size == 0:
+        return 0.0
+    rms = np.sqrt(np.dot(audio_data, audio_data) / audio_data.size)
+    peak = max(audio_data.max(), -audio_data.min())
+    if rms <= 0:
+        return 0.0
+    return float(20 * np.log10(peak / rms))
+
+
+@functools.lru_cache(maxsize=16)
+def _voice_band_filter(sample_rate: int, fir: bool) -> np.ndarray:
+    """
+    Design the 80 Hz - 8 kHz voice band-pass once per sample rate.
+    
+    Returns float32 FIR taps when `fir` is set, otherwise the float64
+    second-order sections of a 4th-order Butterworth filter. The 8 kHz
+    edge is dropped when it would sit above 95% of Nyquist.
+    """
+    nyquist = sample_rate / 2
+    cutoff = [80, 8000] if 8000 < 0.95 * nyquist else 80
+    
+    if fir:
+        return firwin(FIR_NUM_TAPS, cutoff, pass_zero=False, fs=sample_rate).astype(np.float32)
+    btype = 'band' if isinstance(cutoff, list) else 'high'
+    return butter(4, cutoff, btype=btype, fs=sample_rate, output='sos')
+
+
 def clean_voice_sample(
     voice_path: str, 
     output_path: Optional[str] = None,
     reduce_noise: bool = True,
     normalize_audio: bool = True,
     apply_filters: bool = True,
-    trim_silence: bool = True
+    trim_silence: bool = True,
+    skip_if_clean_db: Optional[float] = CLEAN_SAMPLE_THRESHOLD_DB,
+    target_sr: Optional[int] = VOICE_SAMPLE_RATE
 ) -> str:
     """
     Clean and enhance voice sample by reducing noise and normalizing.
@@ -107,9 +378,17 @@ def clean_voice_sample(
         normalize_audio (bool): Normalize audio levels
         apply_filters (bool): Apply audio filters
         trim_silence (bool): Trim silence from beginning and end
+        skip_if_clean_db (float, optional): Return voice_path untouched when the
+            estimated SNR (peak-to-RMS, dB) exceeds this. Only applies when
+            output_path is None; an explicit output_path is always written.
+            None always cleans
+        target_sr (int, optional): Downsample to this rate before processing, so
+            every later stage (and the TTS speaker encoder) handles less data.
+            None keeps the original rate
     
     Returns:
-        str: Path to cleaned voice sample
+        str: Path to cleaned voice sample (voice_path itself if it was already
+        clean and no output_path was given)
     
     Raises:
         FileNotFoundError: If input voice file doesn't exist
@@ -118,9 +397,19 @@ def clean_voice_sample(
     if not os.path.exists(voice_path):
         raise FileNotFoundError(f"Voice sample not found: {voice_path}")
     
+    load_voice_dependencies()
+    
     try:
         # Load audio
-        audio_data, sample_rate = librosa.load(voice_path, sr=None)
+        audio_data, sample_rate = _load_audio_mono(voice_path)
+        
+        # Studio-quality samples gain nothing from the DSP chain below; callers
+        # that asked for a specific output file still get it written
+        if skip_if_clean_db is not None and output_path is None:
+            snr_db = _estimate_snr_db(audio_data)
+            if snr_db > skip_if_clean_db:
+                print(f"✅ Voice sample already clean (~{snr_db:.1f} dB), skipping cleaning: {voice_path}")
+                return voice_path
         
         # Create output path if not provided
         if output_path is None:
@@ -129,6 +418,14 @@ def clean_voice_sample(
         
         print(f"🔧 Cleaning voice sample: {voice_path}")
         
+        # 0. Resample once up front; the speaker encoder would resample anyway
+        if target_sr is not None and sample_rate > target_sr:
+            print(f"   - Resampling {sample_rate} Hz -> {target_sr} Hz...")
+            audio_data = librosa.resample(
+                audio_data, orig_sr=sample_rate, target_sr=target_sr, res_type='soxr_hq'
+            )
+            sample_rate = target_sr
+        
         # 1. Noise Reduction
         if reduce_noise and NOISE_REDUCTION_AVAILABLE:
             print("   - Applying noise reduction...")
@@ -136,47 +433,66 @@ def clean_voice_sample(
             noise_sample_duration = min(1.0, len(audio_data) / sample_rate / 4)
             noise_sample_length = int(noise_sample_duration * sample_rate)
             
-            audio_data = nr.reduce_noise(
-                y=audio_data, 
+            # float32 halves the STFT memory traffic; noisereduce>=3 can run
+            # the STFT/gating on torch (cuFFT on GPU) instead of numpy
+            noise_kwargs = {}
+            if torch is not None:
+                noise_kwargs = {
+                    "use_torch": True,
+                    "device": "cuda" if torch.cuda.is_available() else "cpu",
+                }
+            
+            audio_data = np.asarray(nr.reduce_noise(
+                y=audio_data.astype(np.float32, copy=False), 
                 sr=sample_rate,
                 stationary=True,
-                prop_decrease=0.8
-            )
+                prop_decrease=0.8,
+                n_fft=1024,
+                win_length=1024,
+                hop_length=256,
+                **noise_kwargs
+            ), dtype=np.float32)
         
         # 2. Apply filters to remove low/high frequency noise
         if apply_filters and SCIPY_AVAILABLE:
             print("   - Applying audio filters...")
-            # High-pass filter to remove low frequency noise (below 80 Hz)
-            nyquist = sample_rate / 2
-            low_cutoff = 80 / nyquist
-            high_cutoff = min(8000 / nyquist, 0.95)  # Low-pass at 8kHz or 95% Nyquist
-            
-            if low_cutoff < 0.95:
-                b, a = butter(2, low_cutoff, btype='high')
-                audio_data = filtfilt(b, a, audio_data)
-            
-            if high_cutoff < 0.95:
-                b, a = butter(2, high_cutoff, btype='low')
-                audio_data = filtfilt(b, a, audio_data)
+            if len(audio_data) / sample_rate > LONG_SAMPLE_SECONDS:
+                # Long clips: linear-phase FIR applied by overlap-add FFT
+                # convolution, which scales far better than a time-domain IIR
+                audio_data = oaconvolve(audio_data, _voice_band_filter(sample_rate, True), mode='same')
+            else:
+                # Short clips: one zero-phase pass over second-order sections,
+                # which stay numerically stable where ba coefficients do not
+                audio_data = sosfiltfilt(_voice_band_filter(sample_rate, False), audio_data)
+            # scipy computes in float64; keep the rest of the chain in float32
+            audio_data = audio_data.astype(np.float32, copy=False)
         
         # 3. Normalize audio
         if normalize_audio:
             print("   - Normalizing audio levels...")
+            # Work in place: this section is memory-bound, so avoid the
+            # temporaries of `x - mean`, `abs(x)` and `x / max`
+            audio_data = np.ascontiguousarray(audio_data)
+            if not audio_data.flags.writeable:
+                audio_data = audio_data.copy()
+            
             # Remove DC offset
-            audio_data = audio_data - np.mean(audio_data)
+            np.subtract(audio_data, audio_data.mean(), out=audio_data)
             
             # Normalize to prevent clipping (leave some headroom)
-            max_amplitude = np.max(np.abs(audio_data))
+            max_amplitude = max(audio_data.max(), -audio_data.min())
             if max_amplitude > 0:
-                audio_data = audio_data / max_amplitude * 0.9
+                np.multiply(audio_data, 0.9 / max_amplitude, out=audio_data)
         
         # 4. Trim silence from beginning and end
         if trim_silence:
             print("   - Trimming silence...")
-            audio_data, _ = librosa.effects.trim(audio_data, top_db=30)
+            find_bounds = _find_trim_bounds if NUMBA_AVAILABLE else _find_trim_bounds_vectorized
+            start, end = find_bounds(audio_data, 30.0, 2048, 512)
+            audio_data = audio_data[start:end]
         
         # Save cleaned audio
-        sf.write(output_path, audio_data, sample_rate)
+        _write_pcm16(output_path, audio_data, sample_rate)
         print(f"✅ Cleaned voice sample saved: {output_path}")
         
         return output_path
@@ -185,12 +501,701 @@ def clean_voice_sample(
         raise Exception(f"Error cleaning voice sample: {str(e)}")
 
 
+# Output caching helpers
+@functools.lru_cache(maxsize=256)
+def _file_digest_cached(path: str, mtime_ns: int, size: int) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _file_digest(path: str) -> str:
+    """SHA-256 of a file's contents, re-hashed only when its mtime or size changes."""
+    stat = os.stat(path)
+    return _file_digest_cached(os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+
+
+def _prune_audio_cache() -> None:
+    """Delete least recently used cache files until the cache fits AUDIO_CACHE_MAX_BYTES."""
+    entries = []
+    with os.scandir(AUDIO_CACHE_DIR) as it:
+        for entry in it:
+            if entry.is_file() and not entry.name.endswith('.tmp'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+    
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):  # Oldest (least recently used) first
+        if total <= AUDIO_CACHE_MAX_BYTES:
+            break
+        try:
+            os.unlink(path)
+            total -= size
+        except OSError:
+            pass  # Already evicted by another worker
+
+
+def _audio_cache_params(signature, args, kwargs) -> Tuple[dict, Optional[Callable[[float], None]]]:
+    """Bind a call's arguments for keying, minus the callbacks; returns (params, progress_callback)."""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    params = dict(bound.arguments)
+    # Callbacks only observe (or abort) the run; they don't change the audio
+    progress_callback = params.pop("progress_callback", None)
+    params.pop("should_cancel", None)
+    return params, progress_callback
+
+
+def _audio_cache_path(func_name: str, params: dict, file_params: Tuple[str, ...], suffix: str) -> Optional[str]:
+    """Cache file for a call, or None when caching is disabled or an input file is missing."""
+    if not AUDIO_CACHE_DIR or not all(os.path.exists(params[name]) for name in file_params):
+        return None
+    
+    key_parts = [func_name]
+    for name, value in sorted(params.items()):
+        if name in file_params:
+            value = _file_digest(value)
+        key_parts.append(f"{name}={value!r}")
+    key = hashlib.sha256("\n".join(key_parts).encode()).hexdigest()
+    return os.path.join(AUDIO_CACHE_DIR, key + suffix)
+
+
+def _audio_cache_tmp_path(cached_path: str) -> str:
+    """Per-thread scratch name next to `cached_path`, ignored by _prune_audio_cache."""
+    return f"{cached_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+
+def _commit_cached_audio(tmp_path: str, cached_path: str) -> None:
+    """Move a finished scratch file into the cache, unless it alone would overflow it."""
+    if os.path.getsize(tmp_path) > AUDIO_CACHE_MAX_BYTES:
+        os.unlink(tmp_path)  # Would evict everything else (and itself)
+        return
+    os.replace(tmp_path, cached_path)  # Atomic, so readers never see partial files
+    _prune_audio_cache()
+
+
+def _cache_audio_output(*file_params: str):
+    """
+    Memoize a convert_* function's output file on disk.
+    
+    The key combines the function name, the contents of the `file_params`
+    input files and the repr of every other argument except output_path
+    and the progress_callback/should_cancel callbacks.
+    A hit copies the cached audio to output_path without running any TTS.
+    Hits refresh a file's mtime, and the oldest files are evicted once the
+    directory grows past AUDIO_CACHE_MAX_BYTES.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            params, progress_callback = _audio_cache_params(signature, args, kwargs)
+            output_path = params.pop("output_path")
+            
+            cached_path = _audio_cache_path(func.__name__, params, file_params, Path(output_path).suffix)
+            if cached_path is None:
+                return func(*args, **kwargs)
+            
+            try:
+                shutil.copyfile(cached_path, output_path)
+                os.utime(cached_path)  # Mark as recently used for eviction
+            except FileNotFoundError:
+                pass  # Not cached yet, or evicted meanwhile
+            else:
+                print(f"♻️ Using cached audio: {cached_path}")
+                if progress_callback is not None:
+                    progress_callback(1.0)
+                return output_path
+            
+            result_path = func(*args, **kwargs)
+            
+            try:
+                os.makedirs(AUDIO_CACHE_DIR, exist_ok=True)
+                tmp_path = _audio_cache_tmp_path(cached_path)
+                shutil.copyfile(result_path, tmp_path)
+                _commit_cached_audio(tmp_path, cached_path)
+            except OSError as e:
+                print(f"Warning: could not cache audio output: {e}")
+            
+            return result_path
+        
+        return wrapper
+    return decorator
+
+
+def _cache_audio_stream(cache_as: str, *file_params: str):
+    """
+    Memoize a stream_* function's 16-bit mono WAV stream in the audio cache.
+    
+    Entries are shared with the convert_* function named `cache_as`, which
+    takes the same arguments plus output_path. A hit streams the cached file
+    without running any TTS. On a miss the stream is written to the cache
+    as it is yielded, and kept only if the caller reads it to the end.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            params, progress_callback = _audio_cache_params(signature, args, kwargs)
+            
+            cached_path = _audio_cache_path(cache_as, params, file_params, ".wav")
+            if cached_path is None:
+                yield from func(*args, **kwargs)
+                return
+            
+            try:
+                cached = sf.SoundFile(cached_path)
+            except (OSError, RuntimeError):
+                pass  # Not cached yet, or evicted meanwhile
+            else:
+                with cached:
+                    os.utime(cached_path)  # Mark as recently used for eviction
+                    print(f"♻️ Using cached audio: {cached_path}")
+                    yield _wav_header(cached.samplerate)
+                    for block in cached.blocks(PCM_WRITE_BLOCK, dtype='int16'):
+                        yield block.tobytes()
+                if progress_callback is not None:
+                    progress_callback(1.0)
+                return
+            
+            tmp_path = _audio_cache_tmp_path(cached_path)
+            try:
+                os.makedirs(AUDIO_CACHE_DIR, exist_ok=True)
+                cache_file = open(tmp_path, 'wb')
+            except OSError as e:
+                print(f"Warning: could not cache audio output: {e}")
+                yield from func(*args, **kwargs)
+                return
+            
+            completed = False
+            try:
+                header = None
+                for chunk in func(*args, **kwargs):
+                    cache_file.write(chunk)
+                    if header is None:
+                        header = chunk  # The streaming header, sizes unknown
+                    yield chunk
+                completed = True
+            finally:
+                cache_file.close()
+                if not completed:
+                    os.unlink(tmp_path)  # Cancelled, failed or abandoned mid-stream
+            
+            try:
+                # Give the cached file its final chunk sizes
+                sample_rate = struct.unpack_from('<I', header, 24)[0]
+                num_frames = (os.path.getsize(tmp_path) - len(header)) // 2
+                with open(tmp_path, 'r+b') as f:
+                    f.write(_wav_header(sample_rate, num_frames))
+                _commit_cached_audio(tmp_path, cached_path)
+            except OSError as e:
+                print(f"Warning: could not cache audio output: {e}")
+        
+        return wrapper
+    return decorator
+
+
+# Chunked synthesis helpers
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+')  # Whitespace after sentence-ending punctuation
+_SPEAKABLE = re.compile(r'\w')
+
+
+def split_sentences(text: str) -> List[str]:
+    """
+    Split text into sentences suitable for chunked synthesis.
+    
+    Args:
+        text (str): Text to split
+    
+    Returns:
+        List[str]: Sentences that contain at least one speakable character
+    """
+    sentences = _SENTENCE_SPLIT.split(text)
+    return [s.strip() for s in sentences if _SPEAKABLE.search(s)]
+
+
+def _ordered_map(executor, fn: Callable, items: Iterable, lookahead: int) -> Iterator:
+    """Yield fn(item) in input order while keeping `lookahead` calls in flight."""
+    pending = deque()
+    try:
+        for item in items:
+            pending.append(executor.submit(fn, item))
+            if len(pending) > lookahead:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _apply_fade(audio_data: np.ndarray, fade_length: int) -> np.ndarray:
+    """Apply a short linear fade-in/out in place to hide clicks at chunk boundaries."""
+    fade_length = min(fade_length, len(audio_data) // 2)
+    if fade_length > 0:
+        ramp = np.linspace(0.0, 1.0, fade_length, dtype=audio_data.dtype)
+        audio_data[:fade_length] *= ramp
+        audio_data[-fade_length:] *= ramp[::-1]
+    return audio_data
+
+
+def _synthesize_gtts_sentence(sentence: str, language: str, slow: bool) -> bytes:
+    """Synthesize one sentence with gTTS and return the MP3 bytes."""
+    buffer = BytesIO()
+    gTTS(text=sentence, lang=language, slow=slow).write_to_fp(buffer)
+    return buffer.getvalue()
+
+
+def _strip_id3(mp3_bytes: bytes) -> bytes:
+    """Drop a leading ID3v2 tag, so concatenated MP3 chunks carry no tags mid-stream."""
+    if len(mp3_bytes) < 10 or mp3_bytes[:3] != b'ID3':
+        return mp3_bytes
+    # Tag size is a 28-bit "syncsafe" integer (7 bits per byte), excluding the header
+    size = (mp3_bytes[6] << 21) | (mp3_bytes[7] << 14) | (mp3_bytes[8] << 7) | mp3_bytes[9]
+    size += 10
+    if mp3_bytes[5] & 0x10:  # Footer present
+        size += 10
+    return mp3_bytes[size:]
+
+
+def _batched(items: Iterable, batch_size: int) -> Iterator[list]:
+    """Group items into lists of at most `batch_size` elements."""
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _growing_batches(items: Iterable, first_size: int, max_size: int) -> Iterator[list]:
+    """Like _batched, but start with `first_size` items and double the size up to `max_size`."""
+    iterator = iter(items)
+    size = first_size
+    while True:
+        batch = list(itertools.islice(iterator, size))
+        if not batch:
+            return
+        yield batch
+        size = min(size * 2, max_size)
+
+
+def _supports_batched_inference(tts) -> bool:
+    """Check whether the loaded Coqui model accepts padded batches with d-vectors (e.g. YourTTS/VITS)."""
+    model = tts.synthesizer.tts_model
+    speaker_manager = getattr(model, "speaker_manager", None)
+    return (
+        torch is not None
+        and getattr(model, "tokenizer", None) is not None
+        and hasattr(model, "inference")
+        and speaker_manager is not None
+        and getattr(speaker_manager, "encoder", None) is not None
+    )
+
+
+def _resolve_gpu(gpu: Optional[bool]) -> bool:
+    """Use the GPU when asked to, or by default whenever CUDA is available."""
+    if gpu is None:
+        return torch is not None and torch.cuda.is_available()
+    return gpu
+
+
+def _enable_deepspeed(tts) -> None:
+    """Switch XTTS's GPT decoder to DeepSpeed inference kernels when DeepSpeed is installed."""
+    gpt = getattr(tts.synthesizer.tts_model, "gpt", None)
+    if not hasattr(gpt, "init_gpt_for_inference"):
+        return  # Only XTTS has a GPT decoder; VITS/YourTTS run as-is
+    try:
+        import deepspeed  # noqa: F401
+    except ImportError:
+        return
+    gpt.init_gpt_for_inference(kv_cache=True, use_deepspeed=True)
+    print("⚡ DeepSpeed inference enabled")
+
+
+def get_tts_model(model_name: str = DEFAULT_VOICE_MODEL, gpu: Optional[bool] = None):
+    """
+    Return the Coqui TTS model for `model_name`, loading it only on first use.
+    
+    The model stays in memory for the life of the process, so later
+    conversions (and Streamlit reruns) skip the weight load and device setup.
+    
+    Args:
+        model_name (str): TTS model to use
+        gpu (bool, optional): Run on the GPU. None uses CUDA when available
+    
+    Returns:
+        TTS: The loaded Coqui TTS object
+    
+    Raises:
+        Exception: If Coqui TTS is not installed
+    """
+    load_voice_dependencies()
+    if TTS is None:
+        raise Exception("TTS not available. Install with: pip install TTS")
+    
+    gpu = _resolve_gpu(gpu)
+    with _TTS_CACHE_LOCK:
+        tts = _TTS_CACHE.get((model_name, gpu))
+        if tts is None:
+            print(f"🤖 Loading TTS model: {model_name} ({'GPU' if gpu else 'CPU'})")
+            tts = TTS(model_name, progress_bar=True, gpu=gpu)
+            if gpu:
+                _enable_deepspeed(tts)
+            _TTS_CACHE[(model_name, gpu)] = tts
+        else:
+            print(f"🤖 Using cached TTS model: {model_name}")
+        return tts
+
+
+def _inference_precision(tts, half_precision: bool):
+    """
+    Context for running the model: FP16 autocast on CUDA, plain FP32 otherwise.
+    
+    Autocast keeps precision-sensitive ops (LayerNorm, softmax, reductions)
+    in FP32 while matmuls/convolutions, and thus the vocoder, run in FP16.
+    """
+    device = next(tts.synthesizer.tts_model.parameters()).device
+    if half_precision and device.type == 'cuda':
+        return torch.autocast(device_type='cuda', dtype=torch.float16)
+    return contextlib.nullcontext()
+
+
+def _get_speaker_embedding(
+    model_name: str,
+    voice_path: str,
+    prepare_sample: Callable[[], str],
+    options: tuple,
+    compute: Callable[[str], object]
+):
+    """
+    Return the speaker conditioning of a voice sample, reusing it across calls.
+    
+    `compute` maps the prepared sample's path to what the model conditions
+    on: a d-vector for YourTTS, (gpt_cond_latent, speaker_embedding) for XTTS.
+    Entries are keyed by the sample's contents plus the cleaning `options`,
+    so re-uploads of the same voice (new temp paths) hit the cache too.
+    On a hit neither `prepare_sample` (which cleans the sample and returns
+    the path to embed) nor `compute` runs.
+    """
+    key = (model_name, _file_digest(voice_path), options)
+    
+    with _TTS_CACHE_LOCK:
+        embedding = _SPEAKER_EMBEDDING_CACHE.get(key)
+        if embedding is not None:
+            _SPEAKER_EMBEDDING_CACHE.move_to_end(key)
+            print("♻️ Using cached speaker embedding")
+            return embedding
+    
+    embedding = compute(prepare_sample())
+    
+    with _TTS_CACHE_LOCK:
+        _SPEAKER_EMBEDDING_CACHE[key] = embedding
+        if len(_SPEAKER_EMBEDDING_CACHE) > _SPEAKER_EMBEDDING_CACHE_SIZE:
+            _SPEAKER_EMBEDDING_CACHE.popitem(last=False)
+    return embedding
+
+
+@functools.lru_cache(maxsize=8192)
+def _text_to_ids(tokenizer, text: str, language: str) -> Tuple[int, ...]:
+    """Run Coqui's text frontend (cleaning + phonemization) once per (tokenizer, sentence, language)."""
+    return tuple(tokenizer.text_to_ids(text, language=language))
+
+
+def _synthesize_batch(
+    tts,
+    sentences: List[str],
+    speaker_embedding,
+    language: str,
+    half_precision: bool = False
+) -> List[np.ndarray]:
+    """
+    Run one padded forward pass of the Coqui model over several sentences.
+    
+    The speaker embedding is computed once by the caller and shared by
+    every row of the batch; outputs are cut back to their true lengths.
+    """
+    model = tts.synthesizer.tts_model
+    device = next(model.parameters()).device
+    
+    # Repeated sentences (re-runs, other voices) skip the Python/espeak frontend
+    token_ids = [_text_to_ids(model.tokenizer, sentence, language) for sentence in sentences]
+    x_lengths = torch.tensor([len(ids) for ids in token_ids], dtype=torch.long, device=device)
+    x = torch.zeros((len(token_ids), int(x_lengths.max())), dtype=torch.long, device=device)
+    for row, ids in enumerate(token_ids):
+        x[row, :len(ids)] = torch.as_tensor(ids, dtype=torch.long)
+    
+    d_vectors = torch.as_tensor(speaker_embedding, dtype=torch.float32, device=device)
+    aux_input = {"x_lengths": x_lengths, "d_vectors": d_vectors.reshape(1, -1).repeat(len(token_ids), 1)}
+    
+    language_manager = getattr(model, "language_manager", None)
+    if language_manager is not None:
+        if language not in language_manager.name_to_id:
+            raise Exception(f"Language '{language}' not supported by this model. "
+                            f"Available: {', '.join(language_manager.name_to_id)}")
+        language_id = language_manager.name_to_id[language]
+        aux_input["language_ids"] = torch.full((len(token_ids),), language_id, dtype=torch.long, device=device)
+    
+    with torch.no_grad(), _inference_precision(tts, half_precision):
+        outputs = model.inference(x, aux_input=aux_input)
+    
+    hop_length = model.config.audio.hop_length
+    frame_counts = outputs["y_mask"].sum(dim=(1, 2)).long().tolist()
+    waveforms = outputs["model_outputs"].squeeze(1).float().cpu().numpy()
+    return [waveforms[row, :frames * hop_length] for row, frames in enumerate(frame_counts)]
+
+
+def _wav_header(sample_rate: int, num_frames: Optional[int] = None, channels: int = 1) -> bytes:
+    """
+    Build a 16-bit PCM WAV header.
+    
+    With num_frames=None the chunk sizes are set to their maximum, which is
+    the usual convention for WAV streams whose final length is unknown.
+    """
+    if num_frames is None:
+        data_size = 0xFFFFFFFF - 36
+    else:
+        data_size = num_frames * channels * 2
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + data_size, b'WAVE',
+        b'fmt ', 16, 1, channels, sample_rate, sample_rate * channels * 2, channels * 2, 16,
+        b'data', data_size
+    )
+
+
+def _count_pages(pdf_path: str, page_range: Optional[Tuple[int, int]]) -> int:
+    """Number of pages iter_text_from_pdf visits for `page_range`."""
+    with fitz.open(pdf_path) as doc:
+        start_page = max(page_range[0] if page_range else 0, 0)
+        stop_page = min(page_range[1] + 1 if page_range else doc.page_count, doc.page_count)
+    return max(stop_page - start_page, 1)
+
+
+def _iter_page_sentences(pdf_path: str, page_range: Optional[Tuple[int, int]]) -> Iterator[Tuple[str, float]]:
+    """
+    Stream the speakable sentences of the requested pages in reading order.
+    
+    Pages are extracted and split only as synthesis consumes them, so no
+    document-sized string is ever built. The first sentence is fetched
+    eagerly so that empty or unreadable PDFs fail before any model work.
+    
+    Yields:
+        Tuple[str, float]: A sentence and the fraction of the document
+        (by pages) that is done once it has been spoken
+    """
+    print(f"📖 Extracting text from PDF: {pdf_path}")
+    total_pages = _count_pages(pdf_path, page_range)
+    sentences = (
+        (sentence, min((page_index + (i + 1) / len(page_sentences)) / total_pages, 1.0))
+        for page_index, page_text in enumerate(iter_text_from_pdf(pdf_path, page_range))
+        for page_sentences in (split_sentences(page_text),)
+        for i, sentence in enumerate(page_sentences)
+    )
+    
+    first_sentence = next(sentences, None)
+    if first_sentence is None:
+        raise Exception("No text found in PDF")
+    
+    return itertools.chain([first_sentence], sentences)
+
+
+def _iter_gtts_audio(
+    pdf_path: str,
+    language: str,
+    page_range: Optional[Tuple[int, int]],
+    slow: bool,
+    progress_callback: Optional[Callable[[float], None]] = None,
+    max_workers: int = GTTS_MAX_WORKERS
+) -> Iterator[bytes]:
+    """Yield MP3 chunks for the PDF text, one per sentence, in reading order."""
+    if gTTS is None:
+        raise Exception("gTTS not available. Install with: pip install gtts")
+    
+    # Split pages into sentences so they can be synthesized concurrently
+    sentences = _iter_page_sentences(pdf_path, page_range)
+    
+    print(f"🎙️ Converting to speech using gTTS (language: {language})")
+    
+    def synthesize(item):
+        sentence, fraction = item
+        return _synthesize_gtts_sentence(sentence, language, slow), fraction
+    
+    # gTTS is network-bound, so overlap the HTTPS round-trips and hand out
+    # each MP3 chunk as soon as it (and all before it) finished. The map is
+    # closed before the pool shuts down, so an abandoned stream cancels its
+    # queued requests instead of waiting for them.
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = _ordered_map(pool, synthesize, sentences, lookahead=max_workers * 2)
+        with contextlib.closing(results):
+            for index, (mp3_bytes, fraction) in enumerate(results):
+                # Reported from the consuming thread, so UI callbacks are safe
+                if progress_callback is not None:
+                    progress_callback(fraction)
+                # Only the first chunk keeps its ID3 tag; the rest are bare frames
+                yield mp3_bytes if index == 0 else _strip_id3(mp3_bytes)
+    
+    if progress_callback is not None:
+        progress_callback(1.0)
+
+
+def _prepare_voice_clone(
+    pdf_path: str,
+    reference_voice_path: str,
+    page_range: Optional[Tuple[int, int]],
+    clean_voice: bool,
+    reduce_noise: bool,
+    normalize_audio: bool,
+    apply_filters: bool,
+    trim_silence: bool,
+    model_name: str,
+    language: str,
+    gpu: Optional[bool],
+    half_precision: bool,
+    progress_callback: Optional[Callable[[float], None]] = None,
+    should_cancel: Optional[Callable[[], bool]] = None
+) -> Tuple[int, Iterator[np.ndarray]]:
+    """
+    Load everything voice cloning needs and return its audio stream.
+    
+    Returns:
+        Tuple[int, Iterator[np.ndarray]]: Output sample rate and a generator
+        of float32 waveform chunks in reading order
+    """
+    load_voice_dependencies()
+    if TTS is None:
+        raise Exception("TTS not available. Install with: pip install TTS")
+    
+    sentences = _iter_page_sentences(pdf_path, page_range)
+    
+    def prepare_voice_sample():
+        # Clean voice sample if requested
+        if not clean_voice:
+            return reference_voice_path
+        print(f"🧹 Cleaning reference voice sample...")
+        return clean_voice_sample(
+            reference_voice_path,
+            output_path=None,  # Auto-generate cleaned filename
+            reduce_noise=reduce_noise,
+            normalize_audio=normalize_audio,
+            apply_filters=apply_filters,
+            trim_silence=trim_silence
+        )
+    
+    # Reuse the warm TTS model instead of reloading weights on every call
+    tts = get_tts_model(model_name, gpu)
+    
+    print(f"🎙️ Converting to speech with voice cloning")
+    print(f"   Reference voice: {reference_voice_path}")
+    
+    sample_rate = tts.synthesizer.output_sample_rate
+    fade_length = int(FADE_DURATION * sample_rate)
+    pause = np.zeros(SENTENCE_PAUSE_SAMPLES, dtype=np.float32)
+    
+    model = tts.synthesizer.tts_model
+    # A sample seen before (same contents and cleaning options) skips
+    # cleaning and conditioning altogether
+    cleaning_options = None
+    if clean_voice:
+        cleaning_options = (reduce_noise, normalize_audio, apply_filters, trim_silence)
+    
+    if hasattr(model, "get_conditioning_latents"):
+        # XTTS: compute the conditioning latents once for the whole document
+        # instead of letting tts.tts() recompute them for every sentence
+        gpt_cond_latent, xtts_speaker_embedding = _get_speaker_embedding(
+            model_name, reference_voice_path, prepare_voice_sample, cleaning_options,
+            lambda path: model.get_conditioning_latents(audio_path=[path])
+        )
+        
+        def synthesize(window):
+            with _inference_precision(tts, half_precision):
+                wavs = [
+                    model.inference(sentence, language, gpt_cond_latent, xtts_speaker_embedding)["wav"]
+                    for sentence in window
+                ]
+            # Direct inference skips the Synthesizer, so add its sentence pause
+            return np.concatenate([
+                piece
+                for wav in wavs
+                for piece in (_apply_fade(np.asarray(wav, dtype=np.float32), fade_length), pause)
+            ])
+    elif _supports_batched_inference(tts):
+        # Extract the speaker embedding once for the whole document
+        speaker_embedding = _get_speaker_embedding(
+            model_name, reference_voice_path, prepare_voice_sample, cleaning_options,
+            model.speaker_manager.compute_embedding_from_clip
+        )
+        
+        def synthesize(window):
+            # Batch sentences of similar length together so rows carry little
+            # padding, then put the audio back in reading order
+            order = sorted(range(len(window)), key=lambda i: len(window[i]))
+            wavs = [None] * len(window)
+            for rows in _batched(order, COQUI_BATCH_SIZE):
+                batch_wavs = _synthesize_batch(
+                    tts, [window[i] for i in rows], speaker_embedding, language, half_precision
+                )
+                for i, wav in zip(rows, batch_wavs):
+                    wavs[i] = wav
+            return np.concatenate([
+                piece
+                for wav in wavs
+                for piece in (_apply_fade(np.asarray(wav, dtype=np.float32), fade_length), pause)
+            ])
+    else:
+        print("   Model does not support batched inference, synthesizing sentence by sentence")
+        voice_sample_path = prepare_voice_sample()
+        
+        def synthesize(window):
+            with _inference_precision(tts, half_precision):
+                return np.concatenate([
+                    _apply_fade(np.asarray(
+                        tts.tts(text=sentence, speaker_wav=voice_sample_path, language=language),
+                        dtype=np.float32
+                    ), fade_length)
+                    for sentence in window
+                ])
+    
+    def synthesize_window(items):
+        # Each window reports the progress fraction of its last sentence
+        return synthesize([sentence for sentence, _ in items]), items[-1][1]
+    
+    def audio_chunks():
+        # Synthesize window i+1 while the consumer handles window i
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            # The first window is a single batch so audio starts quickly; later
+            # ones grow to COQUI_SORT_WINDOW for better length grouping
+            windows = _growing_batches(sentences, COQUI_BATCH_SIZE, COQUI_SORT_WINDOW)
+            results = _ordered_map(pool, synthesize_window, windows, lookahead=1)
+            with contextlib.closing(results):
+                for wav, fraction in results:
+                    if should_cancel is not None and should_cancel():
+                        # Leaving the loop cancels the queued window as well
+                        raise Exception("Conversion cancelled")
+                    if progress_callback is not None:
+                        progress_callback(fraction)
+                    yield wav
+        
+        if progress_callback is not None:
+            progress_callback(1.0)
+    
+    return sample_rate, audio_chunks()
+
+
+@_cache_audio_output("pdf_path")
 def convert_pdf_to_speech_gtts(
     pdf_path: str,
     output_path: str,
     language: str = 'en',
     page_range: Optional[Tuple[int, int]] = None,
-    slow: bool = False
+    slow: bool = False,
+    progress_callback: Optional[Callable[[float], None]] = None
 ) -> str:
     """
     Convert PDF to speech using Google Text-to-Speech (gTTS).
@@ -201,6 +1206,7 @@ def convert_pdf_to_speech_gtts(
         language (str): Language code for TTS (default: 'en')
         page_range (tuple, optional): (start_page, end_page) to convert specific pages
         slow (bool): Speak slowly
+        progress_callback (callable, optional): Called with the finished fraction (0.0-1.0)
     
     Returns:
         str: Path to generated audio file
@@ -208,27 +1214,11 @@ def convert_pdf_to_speech_gtts(
     Raises:
         Exception: If conversion fails
     """
-    if gTTS is None:
-        raise Exception("gTTS not available. Install with: pip install gtts")
-    
     try:
-        print(f"📖 Extracting text from PDF: {pdf_path}")
-        pages_text = extract_text_from_pdf(pdf_path, page_range)
-        
-        if not pages_text:
-            raise Exception("No text found in PDF")
-        
-        # Combine all pages text
-        full_text = "\n\n".join(pages_text)
-        
-        print(f"🎙️ Converting to speech using gTTS (language: {language})")
-        print(f"   Text length: {len(full_text)} characters")
-        
-        # Create gTTS object
-        tts = gTTS(text=full_text, lang=language, slow=slow)
-        
-        # Save audio
-        tts.save(output_path)
+        # MP3 frames with identical encoding parameters concatenate cleanly
+        with open(output_path, 'wb') as f:
+            for mp3_bytes in _iter_gtts_audio(pdf_path, language, page_range, slow, progress_callback):
+                f.write(mp3_bytes)
         
         print(f"✅ Speech generated using gTTS: {output_path}")
         return output_path
@@ -237,6 +1227,36 @@ def convert_pdf_to_speech_gtts(
         raise Exception(f"Error in PDF to speech conversion (gTTS): {str(e)}")
 
 
+def stream_pdf_to_speech_gtts(
+    pdf_path: str,
+    language: str = 'en',
+    page_range: Optional[Tuple[int, int]] = None,
+    slow: bool = False,
+    progress_callback: Optional[Callable[[float], None]] = None
+) -> Iterator[bytes]:
+    """
+    Stream PDF speech from gTTS as MP3 chunks while it is being synthesized.
+    
+    Args:
+        pdf_path (str): Path to PDF file
+        language (str): Language code for TTS (default: 'en')
+        page_range (tuple, optional): (start_page, end_page) to convert specific pages
+        slow (bool): Speak slowly
+        progress_callback (callable, optional): Called with the finished fraction (0.0-1.0)
+    
+    Yields:
+        bytes: MP3 data, one chunk per sentence; the concatenation is a valid MP3
+    
+    Raises:
+        Exception: If conversion fails
+    """
+    try:
+        yield from _iter_gtts_audio(pdf_path, language, page_range, slow, progress_callback)
+    except Exception as e:
+        raise Exception(f"Error in PDF to speech streaming (gTTS): {str(e)}")
+
+
+@_cache_audio_output("pdf_path", "reference_voice_path")
 def convert_pdf_to_speech_voice_clone(
     pdf_path: str,
     reference_voice_path: str,
@@ -247,8 +1267,12 @@ def convert_pdf_to_speech_voice_clone(
     normalize_audio: bool = True,
     apply_filters: bool = True,
     trim_silence: bool = True,
-    model_name: str = "tts_models/multilingual/multi-dataset/your_tts",
-    language: str = "en"
+    model_name: str = DEFAULT_VOICE_MODEL,
+    language: str = "en",
+    gpu: Optional[bool] = None,
+    half_precision: bool = True,
+    progress_callback: Optional[Callable[[float], None]] = None,
+    should_cancel: Optional[Callable[[], bool]] = None
 ) -> str:
     """
     Convert PDF to speech using voice cloning with Coqui TTS..
@@ -265,6 +1289,10 @@ def convert_pdf_to_speech_voice_clone(
         trim_silence (bool): Trim silence (if clean_voice=True)
         model_name (str): TTS model to use
         language (str): Language code
+        gpu (bool, optional): Run on the GPU. None uses CUDA when available
+        half_precision (bool): Use FP16 autocast for inference on the GPU
+        progress_callback (callable, optional): Called with the finished fraction (0.0-1.0)
+        should_cancel (callable, optional): Polled between batches; returning True aborts
     
     Returns:
         str: Path to generated audio file
@@ -272,49 +1300,18 @@ def convert_pdf_to_speech_voice_clone(
     Raises:
         Exception: If conversion fails
     """
-    if TTS is None:
-        raise Exception("TTS not available. Install with: pip install TTS")
-    
     try:
-        print(f"📖 Extracting text from PDF: {pdf_path}")
-        pages_text = extract_text_from_pdf(pdf_path, page_range)
-        
-        if not pages_text:
-            raise Exception("No text found in PDF")
-        
-        # Combine all pages text
-        full_text = "\n\n".join(pages_text)
-        
-        # Clean voice sample if requested
-        voice_sample_path = reference_voice_path
-        if clean_voice:
-            print(f"🧹 Cleaning reference voice sample...")
-            voice_sample_path = clean_voice_sample(
-                reference_voice_path,
-                output_path=None,  # Auto-generate cleaned filename
-                reduce_noise=reduce_noise,
-                normalize_audio=normalize_audio,
-                apply_filters=apply_filters,
-                trim_silence=trim_silence
-            )
-        
-        print(f"🤖 Loading TTS model: {model_name}")
-        
-        # Initialize TTS model
-        tts = TTS(model_name, progress_bar=True, gpu=False)
-        
-        print(f"🎙️ Converting to speech with voice cloning")
-        print(f"   Text length: {len(full_text)} characters")
-        print(f"   Reference voice: {voice_sample_path}")
-        
-        # Generate speech with voice cloning
-        tts.tts_to_file(
-            text=full_text,
-            speaker_wav=voice_sample_path,
-            language=language,
-            file_path=output_path
+        sample_rate, audio_chunks = _prepare_voice_clone(
+            pdf_path, reference_voice_path, page_range, clean_voice,
+            reduce_noise, normalize_audio, apply_filters, trim_silence, model_name, language,
+            gpu, half_precision, progress_callback, should_cancel
         )
         
+        # Write each batch as soon as it is synthesized
+        with sf.SoundFile(output_path, 'w', samplerate=sample_rate, channels=1) as out:
+            for wav in audio_chunks:
+                out.write(wav)
+        
         print(f"✅ Cloned speech generated: {output_path}")
         return output_path
         
@@ -322,6 +1319,62 @@ def convert_pdf_to_speech_voice_clone(
         raise Exception(f"Error in PDF to speech conversion (voice cloning): {str(e)}")
 
 
+@_cache_audio_stream("convert_pdf_to_speech_voice_clone", "pdf_path", "reference_voice_path")
+def stream_pdf_to_speech_voice_clone(
+    pdf_path: str,
+    reference_voice_path: str,
+    page_range: Optional[Tuple[int, int]] = None,
+    clean_voice: bool = False,
+    reduce_noise: bool = True,
+    normalize_audio: bool = True,
+    apply_filters: bool = True,
+    trim_silence: bool = True,
+    model_name: str = DEFAULT_VOICE_MODEL,
+    language: str = "en",
+    gpu: Optional[bool] = None,
+    half_precision: bool = True,
+    progress_callback: Optional[Callable[[float], None]] = None,
+    should_cancel: Optional[Callable[[], bool]] = None
+) -> Iterator[bytes]:
+    """
+    Stream cloned PDF speech as a 16-bit WAV byte stream while it is being synthesized.
+    
+    Takes the same arguments as convert_pdf_to_speech_voice_clone, minus output_path.
+    
+    Yields:
+        bytes: A streaming WAV header first, then PCM frames per synthesized batch
+    
+    Raises:
+        Exception: If conversion fails
+    """
+    try:
+        sample_rate, audio_chunks = _prepare_voice_clone(
+            pdf_path, reference_voice_path, page_range, clean_voice,
+            reduce_noise, normalize_audio, apply_filters, trim_silence, model_name, language,
+            gpu, half_precision, progress_callback, should_cancel
+        )
+        
+        yield _wav_header(sample_rate)
+        for wav in audio_chunks:
+            yield _to_pcm16(wav).tobytes()
+        
+    except Exception as e:
+        raise Exception(f"Error in PDF to speech streaming (voice cloning): {str(e)}")
+
+
+def _describe_pdf(doc) -> dict:
+    """Collect the info dict for an open document."""
+    # page_count and metadata come from the trailer/page tree; no page is loaded
+    metadata = doc.metadata or {}
+    return {
+        "page_count": doc.page_count,
+        "title": metadata.get("title", "Unknown"),
+        "author": metadata.get("author", "Unknown"),
+        "subject": metadata.get("subject", ""),
+        "creator": metadata.get("creator", ""),
+    }
+
+
 def get_pdf_info(pdf_path: str) -> dict:
     """
     Get information about a PDF file.
@@ -333,89 +1386,153 @@ def get_pdf_info(pdf_path: str) -> dict:
         dict: PDF information including page count, title, etc.
     """
     try:
-        doc = fitz.open(pdf_path)
-        info = {
-            "page_count": len(doc),
-            "title": doc.metadata.get("title", "Unknown"),
-            "author": doc.metadata.get("author", "Unknown"),
-            "subject": doc.metadata.get("subject", ""),
-            "creator": doc.metadata.get("creator", ""),
-        }
-        doc.close()
-        return info
+        with fitz.open(pdf_path) as doc:
+            return _describe_pdf(doc)
     except Exception as e:
         return {"error": str(e)}
 
 
-# Streamlit-ready wrapper functions
-def streamlit_pdf_to_speech_gtts(pdf_file, language='en', page_start=None, page_end=None, slow=False):
-    """Streamlit wrapper for gTTS conversion."""
-    with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_pdf:
-        tmp_pdf.write(pdf_file.read())
-        tmp_pdf_path = tmp_pdf.name
+def get_pdf_info_bytes(data: bytes) -> dict:
+    """
+    Get information about an in-memory PDF, without writing it to disk.
     
-    with tempfile.NamedTemporaryFile(suffix='.mp3', delete=False) as tmp_audio:
-        tmp_audio_path = tmp_audio.name
+    Args:
+        data (bytes): PDF file contents
     
+    Returns:
+        dict: PDF information including page count, title, etc.
+    """
     try:
-        page_range = None
-        if page_start is not None and page_end is not None:
-            page_range = (page_start - 1, page_end - 1)  # Convert to 0-based indexing
-        
-        result_path = convert_pdf_to_speech_gtts(
-            tmp_pdf_path, tmp_audio_path, language, page_range, slow
-        )
-        
-        # Read audio file for return
-        with open(result_path, 'rb') as f:
-            audio_data = f.read()
-        
-        return audio_data, result_path
-        
-    finally:
-        # Cleanup
-        try:
-            os.unlink(tmp_pdf_path)
-        except:
-            pass
+        with fitz.open(stream=data, filetype="pdf") as doc:
+            return _describe_pdf(doc)
+    except Exception as e:
+        return {"error": str(e)}
 
 
-def streamlit_pdf_to_speech_clone(pdf_file, voice_file, language='en', page_start=None, page_end=None, clean_voice=False, reduce_noise=True, normalize_audio=True, apply_filters=True, trim_silence=True):
-    """Streamlit wrapper for voice cloning conversion."""
-    with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_pdf:
-        tmp_pdf.write(pdf_file.read())
-        tmp_pdf_path = tmp_pdf.name
-    
-    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_voice:
-        tmp_voice.write(voice_file.read())
-        tmp_voice_path = tmp_voice.name
+def get_audio_info_bytes(data: bytes) -> dict:
+    """
+    Get information about an in-memory audio file from its header, without decoding it.
     
-    with tempfile.NamedTemporaryFile(suffix='.wav', delete=False) as tmp_audio:
-        tmp_audio_path = tmp_audio.name
+    Args:
+        data (bytes): Audio file contents
     
+    Returns:
+        dict: Duration in seconds, sample rate and channel count
+    """
     try:
-        page_range = None
-        if page_start is not None and page_end is not None:
-            page_range = (page_start - 1, page_end - 1)  # Convert to 0-based indexing
+        info = sf.info(BytesIO(data))
+        return {
+            "duration": info.duration,
+            "sample_rate": info.samplerate,
+            "channels": info.channels,
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def release_memory() -> None:
+    """
+    Free memory left behind by a finished conversion.
+    
+    Collects unreachable Python objects (audio arrays, MP3 buffers) and
+    returns PyTorch's cached, now unused GPU blocks to the driver. Loaded
+    models and caches stay resident.
+    """
+    gc.collect()
+    if torch is not None and torch.cuda.is_available():
+        torch.cuda.empty_cache()
+
+
+# Streamlit-ready wrapper functions
+def _save_upload(file_obj, directory: str, file_name: str) -> str:
+    """Write an uploaded file object into `directory` and return its path."""
+    path = os.path.join(directory, file_name)
+    with open(path, 'wb') as f:
+        if hasattr(file_obj, 'getbuffer'):
+            # In-memory uploads (BytesIO / Streamlit UploadedFile): write a
+            # zero-copy view of the buffer instead of a fresh bytes copy
+            with file_obj.getbuffer() as view:
+                f.write(view)
+        else:
+            # Other file objects are copied in 1 MiB blocks, so memory use
+            # stays bounded however large the upload is
+            if hasattr(file_obj, 'seek'):
+                file_obj.seek(0)
+            shutil.copyfileobj(file_obj, f, length=1 << 20)
+    return path
+
+
+def _to_page_range(page_start, page_end) -> Optional[Tuple[int, int]]:
+    """Convert 1-based UI page numbers to a 0-based page_range."""
+    if page_start is not None and page_end is not None:
+        return (page_start - 1, page_end - 1)
+    return None
+
+
+def streamlit_pdf_to_speech_gtts(pdf_file, language='en', page_start=None, page_end=None, slow=False, progress_callback=None):
+    """Streamlit wrapper for gTTS conversion. Returns the path of the generated MP3."""
+    fd, tmp_audio_path = tempfile.mkstemp(suffix='.mp3')
+    os.close(fd)
+    
+    # Inputs live in one directory that is removed as a whole, even on errors
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_pdf_path = _save_upload(pdf_file, tmp_dir, 'input.pdf')
         
-        result_path = convert_pdf_to_speech_voice_clone(
-            tmp_pdf_path, tmp_voice_path, tmp_audio_path, page_range, clean_voice, 
-            reduce_noise, normalize_audio, apply_filters, trim_silence, language=language
-        )
+        try:
+            # Return the path only; callers stream the file instead of holding it in memory
+            return convert_pdf_to_speech_gtts(
+                tmp_pdf_path, tmp_audio_path, language, _to_page_range(page_start, page_end), slow,
+                progress_callback
+            )
+        except Exception:
+            os.unlink(tmp_audio_path)
+            raise
+
+
+def streamlit_pdf_to_speech_clone(pdf_file, voice_file, language='en', page_start=None, page_end=None, clean_voice=False, reduce_noise=True, normalize_audio=True, apply_filters=True, trim_silence=True, half_precision=True, progress_callback=None, should_cancel=None):
+    """Streamlit wrapper for voice cloning conversion. Returns the path of the generated WAV."""
+    fd, tmp_audio_path = tempfile.mkstemp(suffix='.wav')
+    os.close(fd)
+    
+    # Inputs (and the cleaned voice sample written next to them) live in
+    # one directory that is removed as a whole, even on errors
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_pdf_path = _save_upload(pdf_file, tmp_dir, 'input.pdf')
+        tmp_voice_path = _save_upload(voice_file, tmp_dir, 'voice.wav')
         
-        # Read audio file for return
-        with open(result_path, 'rb') as f:
-            audio_data = f.read()
+        try:
+            # Return the path only; callers stream the file instead of holding it in memory
+            return convert_pdf_to_speech_voice_clone(
+                tmp_pdf_path, tmp_voice_path, tmp_audio_path, _to_page_range(page_start, page_end),
+                clean_voice, reduce_noise, normalize_audio, apply_filters, trim_silence, language=language,
+                half_precision=half_precision, progress_callback=progress_callback, should_cancel=should_cancel
+            )
+        except Exception:
+            os.unlink(tmp_audio_path)
+            raise
+
+
+def streamlit_stream_pdf_to_speech_gtts(pdf_file, language='en', page_start=None, page_end=None, slow=False, progress_callback=None):
+    """Streamlit wrapper that yields MP3 chunks as gTTS synthesizes them."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_pdf_path = _save_upload(pdf_file, tmp_dir, 'input.pdf')
         
-        return audio_data, result_path
+        yield from stream_pdf_to_speech_gtts(
+            tmp_pdf_path, language, _to_page_range(page_start, page_end), slow, progress_callback
+        )
+
+
+def streamlit_stream_pdf_to_speech_clone(pdf_file, voice_file, language='en', page_start=None, page_end=None, clean_voice=False, reduce_noise=True, normalize_audio=True, apply_filters=True, trim_silence=True, half_precision=True, progress_callback=None, should_cancel=None):
+    """Streamlit wrapper that yields a WAV byte stream as the cloned voice is synthesized."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        tmp_pdf_path = _save_upload(pdf_file, tmp_dir, 'input.pdf')
+        tmp_voice_path = _save_upload(voice_file, tmp_dir, 'voice.wav')
         
-    finally:
-        # Cleanup
-        try:
-            os.unlink(tmp_pdf_path)
-            os.unlink(tmp_voice_path)
-        except:
-            pass
+        yield from stream_pdf_to_speech_voice_clone(
+            tmp_pdf_path, tmp_voice_path, _to_page_range(page_start, page_end), clean_voice,
+            reduce_noise, normalize_audio, apply_filters, trim_silence, language=language,
+            half_precision=half_precision, progress_callback=progress_callback, should_cancel=should_cancel
+        )
 
 
 # Example usage and testing functions
@@ -24,9 +24,15 @@ Features:
 """
 
 import streamlit as st
-import tempfile
 import os
+import struct
+import hashlib
+import tempfile
+import importlib
+import weakref
+import threading
 from pathlib import Path
+from types import SimpleNamespace
 import time
 
 st.set_page_config(
@@ -35,17 +41,168 @@ st.set_page_config(
         layout="wide"
     )
 
-# Import our assignment functions
-try:
-    from assignment1 import (
-        streamlit_pdf_to_speech_gtts,
-        streamlit_pdf_to_speech_clone,
-        get_pdf_info,
-        clean_voice_sample
+# Import our assignment functions per mode, so gTTS users never pay for
+# importing torch / Coqui TTS
+def _import_assignment_functions(*names):
+    """Import functions from assignment1, stopping the app with a hint if it is missing."""
+    try:
+        module = importlib.import_module("assignment1")
+    except ImportError:
+        st.error("Please ensure assignment1.py is in the same directory")
+        st.stop()
+    return SimpleNamespace(**{name: getattr(module, name) for name in names})
+
+
+@st.cache_resource(show_spinner=False)
+def _load_gtts_fns():
+    """Functions for the gTTS mode (PDF parsing + gTTS only)."""
+    return _import_assignment_functions("streamlit_pdf_to_speech_gtts", "get_pdf_info_bytes")
+
+
+@st.cache_resource(show_spinner="🤖 Loading voice cloning libraries...")
+def _load_clone_fns():
+    """Functions for the voice cloning mode; imports the heavy dependencies once per process."""
+    fns = _import_assignment_functions(
+        "streamlit_stream_pdf_to_speech_clone",
+        "get_pdf_info_bytes",
+        "get_audio_info_bytes",
+        "clean_voice_sample",
+        "load_voice_dependencies",
+        "get_tts_model",
+        "release_memory"
     )
-except ImportError:
-    st.error("Please ensure assignment1.py is in the same directory")
-    st.stop()
+    fns.load_voice_dependencies()
+    return fns
+
+
+@st.cache_resource(show_spinner="🤖 Loading voice cloning model...")
+def _load_voice_model():
+    """Load the Coqui model once per server process, shared by every session and rerun."""
+    return _load_clone_fns().get_tts_model()
+
+
+def _with_wav_sizes(header: bytes, data_size: int) -> bytes:
+    """Return a copy of a 44-byte WAV header with its RIFF and data chunk sizes set for `data_size` bytes of PCM."""
+    header = bytearray(header)
+    struct.pack_into('<I', header, 4, 36 + data_size)
+    struct.pack_into('<I', header, 40, data_size)
+    return bytes(header)
+
+
+def _remove_file(path: str) -> None:
+    """Delete a file if it still exists."""
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+class _SessionAudioFile:
+    """A file that is deleted once this object (kept in st.session_state) is dropped."""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self._finalizer = weakref.finalize(self, _remove_file, path)
+    
+    def remove(self) -> None:
+        self._finalizer()
+
+
+def _set_session_audio_file(path: str) -> str:
+    """
+    Make `path` this session's output file, deleting the one from its previous conversion.
+    
+    The file is also deleted when the session ends and its state is
+    discarded, or when the server exits.
+    """
+    previous = st.session_state.pop("audio_tempfile", None)
+    if previous is not None:
+        previous.remove()
+    
+    st.session_state["audio_tempfile"] = _SessionAudioFile(path)
+    return path
+
+
+def _new_session_audio_file(suffix: str) -> str:
+    """Create an empty temp file as this session's output file."""
+    with tempfile.NamedTemporaryFile(suffix=suffix, delete=False) as f:
+        return _set_session_audio_file(f.name)
+
+
+class _CloneJob:
+    """
+    A voice cloning conversion running on a worker thread.
+    
+    Synthesis off the script thread keeps the app responsive, so a Cancel
+    click is seen while the job runs rather than after it. Only plain
+    attributes are shared; the script polls them and makes all st.* calls.
+    """
+    
+    def __init__(self, audio_path: str, release_memory):
+        self.audio_path = audio_path
+        self.started_at = int(time.time())
+        self.progress = 0.0
+        self.preview = None  # The first batch as a playable WAV
+        self.error = None
+        self.done = False
+        self._release_memory = release_memory
+        self._cancel_event = threading.Event()
+    
+    def set_progress(self, fraction: float) -> None:
+        self.progress = fraction
+    
+    def is_cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+    
+    def cancel(self) -> None:
+        self._cancel_event.set()
+    
+    def start(self, chunks) -> None:
+        """Write the WAV byte stream `chunks` to `audio_path` on a daemon thread."""
+        threading.Thread(target=self._run, args=(chunks,), daemon=True).start()
+    
+    def _run(self, chunks) -> None:
+        header = None
+        data_size = 0
+        try:
+            with open(self.audio_path, 'wb') as audio_out:
+                for chunk in chunks:
+                    audio_out.write(chunk)
+                    if header is None:
+                        header = chunk  # The first chunk is the bare streaming WAV header
+                        continue
+                    if data_size == 0:
+                        self.preview = _with_wav_sizes(header, len(chunk)) + chunk
+                    data_size += len(chunk)
+                
+                # Give the file its final chunk sizes
+                audio_out.seek(0)
+                audio_out.write(_with_wav_sizes(header, data_size))
+        except Exception as e:
+            self.error = str(e)
+        finally:
+            self._release_memory()
+            self.done = True
+
+
+def _upload_digest(uploaded_file) -> str:
+    """BLAKE2b digest of an upload's contents, hashed in place from its buffer."""
+    with uploaded_file.getbuffer() as view:
+        return hashlib.blake2b(view, digest_size=8).hexdigest()
+
+
+def _session_upload_info(uploaded_file, name: str, compute):
+    """
+    Return compute(contents) for an upload, kept in st.session_state.
+    
+    Widget changes rerun the script; the result is only recomputed when the
+    uploaded contents (by BLAKE2b digest) change.
+    """
+    key = _upload_digest(uploaded_file)
+    if st.session_state.get(f"{name}_key") != key:
+        st.session_state[name] = compute(uploaded_file.getvalue())
+        st.session_state[f"{name}_key"] = key
+    return st.session_state[name]
 
 
 def main():
@@ -60,6 +217,14 @@ def main():
         ["🔊 Simple TTS (gTTS)", "🎭 Voice Cloning (TTS)"]
     )
     
+    fast_mode = True
+    if mode == "🎭 Voice Cloning (TTS)":
+        fast_mode = st.sidebar.toggle(
+            "⚡ Fast mode (FP16)",
+            value=True,
+            help="Run inference in half precision on the GPU (no effect on CPU)"
+        )
+    
     st.sidebar.markdown("---")
     st.sidebar.markdown("### ℹ️ About")
     st.sidebar.markdown("""
@@ -71,13 +236,18 @@ def main():
     if mode == "🔊 Simple TTS (gTTS)":
         gtts_interface()
     else:
-        voice_cloning_interface()
+        voice_cloning_interface(fast_mode)
 
 
+# Each interface is a fragment: its own widget changes rerun only the
+# fragment, not the whole script (navigation, imports, the other mode)
+@st.fragment
 def gtts_interface():
     """Interface for Google Text-to-Speech conversion."""
     st.header("🔊 Simple PDF to Speech (Google TTS)")
     
+    gtts_fns = _load_gtts_fns()
+    
     col1, col2 = st.columns([2, 1])
     
     with col1:
@@ -90,13 +260,8 @@ def gtts_interface():
         
         if uploaded_pdf:
             # Show PDF info
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_file:
-                tmp_file.write(uploaded_pdf.read())
-                tmp_path = tmp_file.name
-                uploaded_pdf.seek(0)  # Reset file pointer
-            
             try:
-                pdf_info = get_pdf_info(tmp_path)
+                pdf_info = _session_upload_info(uploaded_pdf, "gtts_pdf_info", gtts_fns.get_pdf_info_bytes)
                 st.success(f"📖 PDF loaded: {pdf_info.get('page_count', 'Unknown')} pages")
                 
                 if pdf_info.get('title') != 'Unknown':
@@ -105,11 +270,6 @@ def gtts_interface():
             except Exception as e:
                 st.error(f"Error reading PDF: {e}")
                 return
-            finally:
-                try:
-                    os.unlink(tmp_path)
-                except:
-                    pass
     
     with col2:
         # Settings
@@ -143,31 +303,51 @@ def gtts_interface():
     if uploaded_pdf and st.button("🎙️ Convert to Speech", type="primary"):
         with st.spinner("Converting PDF to speech..."):
             try:
-                audio_data, audio_path = streamlit_pdf_to_speech_gtts(
-                    uploaded_pdf, language, page_start, page_end, slow_speech
-                )
+                progress_bar = st.progress(0.0)
+                
+                def update_progress(fraction):
+                    progress_bar.progress(fraction, text=f"Synthesizing speech... {fraction:.0%}")
+                
+                # Repeat conversions are copied from the library's disk cache;
+                # the copy replaces this session's previous output file
+                audio_path = _set_session_audio_file(gtts_fns.streamlit_pdf_to_speech_gtts(
+                    uploaded_pdf, language, page_start, page_end, slow_speech, update_progress
+                ))
+                progress_bar.progress(1.0)
                 
                 st.success("✅ Conversion completed!")
                 
-                # Audio player
-                st.audio(audio_data, format='audio/mp3')
+                # Audio player (served from the file, not an in-memory copy)
+                st.audio(audio_path, format='audio/mp3')
                 
                 # Download button
-                st.download_button(
-                    label="💾 Download Audio",
-                    data=audio_data,
-                    file_name=f"pdf_speech_{int(time.time())}.mp3",
-                    mime="audio/mp3"
-                )
+                with open(audio_path, 'rb') as audio_file:
+                    st.download_button(
+                        label="💾 Download Audio",
+                        data=audio_file,
+                        file_name=f"pdf_speech_{int(time.time())}.mp3",
+                        mime="audio/mp3"
+                    )
                 
             except Exception as e:
                 st.error(f"❌ Conversion failed: {str(e)}")
 
 
-def voice_cloning_interface():
+@st.fragment
+def voice_cloning_interface(fast_mode=True):
     """Interface for voice cloning conversion."""
     st.header("🎭 PDF to Speech with Voice Cloning")
     
+    clone_fns = _load_clone_fns()
+    
+    # Warm the model up front so Convert doesn't pay for the weight load
+    try:
+        _load_voice_model()
+    except Exception as e:
+        st.error(f"❌ Could not load the voice cloning model: {str(e)}")
+        st.info("💡 Check if all dependencies are installed")
+        return
+    
     col1, col2 = st.columns([2, 1])
     
     with col1:
@@ -187,13 +367,8 @@ def voice_cloning_interface():
         
         if uploaded_pdf:
             # Show PDF info
-            with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_file:
-                tmp_file.write(uploaded_pdf.read())
-                tmp_path = tmp_file.name
-                uploaded_pdf.seek(0)  # Reset file pointer
-            
             try:
-                pdf_info = get_pdf_info(tmp_path)
+                pdf_info = _session_upload_info(uploaded_pdf, "clone_pdf_info", clone_fns.get_pdf_info_bytes)
                 st.success(f"📖 PDF loaded: {pdf_info.get('page_count', 'Unknown')} pages")
                 
                 if pdf_info.get('title') != 'Unknown':
@@ -202,18 +377,16 @@ def voice_cloning_interface():
             except Exception as e:
                 st.error(f"Error reading PDF: {e}")
                 return
-            finally:
-                try:
-                    os.unlink(tmp_path)
-                except:
-                    pass
         
         if uploaded_voice:
             st.success("🎤 Voice sample uploaded successfully")
             
-            # Play voice sample
-            st.audio(uploaded_voice.read(), format='audio/wav')
-            uploaded_voice.seek(0)  # Reset file pointer
+            voice_info = _session_upload_info(uploaded_voice, "voice_info", clone_fns.get_audio_info_bytes)
+            if "error" not in voice_info:
+                st.caption(f"⏱️ {voice_info['duration']:.1f} s · {voice_info['sample_rate']} Hz")
+            
+            # Play voice sample (getvalue() leaves the file position untouched)
+            st.audio(uploaded_voice.getvalue(), format='audio/wav')
     
     with col2:
         # Settings
@@ -289,45 +462,74 @@ def voice_cloning_interface():
     
     # Convert button
     if uploaded_pdf and uploaded_voice and st.button("🎭 Clone Voice & Convert", type="primary"):
-        with st.spinner("Converting PDF to speech with voice cloning..."):
-            try:
-                # Show progress
-                progress_bar = st.progress(0)
-                status_text = st.empty()
-                
-                status_text.text("Loading AI models...")
-                progress_bar.progress(25)
-                
-                status_text.text("Processing voice sample...")
-                progress_bar.progress(50)
-                
-                status_text.text("Generating cloned speech...")
-                progress_bar.progress(75)
-                
-                audio_data, audio_path = streamlit_pdf_to_speech_clone(
-                    uploaded_pdf, uploaded_voice, language, page_start, page_end, 
-                    clean_voice, reduce_noise, normalize_audio, apply_filters, trim_silence
-                )
-                
-                progress_bar.progress(100)
-                status_text.text("Conversion completed!")
-                
-                st.success("✅ Voice cloning completed!")
-                
-                # Audio player
-                st.audio(audio_data, format='audio/wav')
-                
-                # Download button
-                st.download_button(
-                    label="💾 Download Cloned Audio",
-                    data=audio_data,
-                    file_name=f"cloned_speech_{int(time.time())}.wav",
-                    mime="audio/wav"
-                )
-                
-            except Exception as e:
-                st.error(f"❌ Voice cloning failed: {str(e)}")
-                st.info("💡 Try uploading a clearer voice sample or check if all dependencies are installed")
+        previous_job = st.session_state.get("clone_job")
+        if previous_job is not None:
+            previous_job.cancel()
+        
+        # Audio goes straight to this session's output file, which
+        # replaces the last one; nothing but the header stays in memory
+        job = _CloneJob(_new_session_audio_file('.wav'), clone_fns.release_memory)
+        job.start(clone_fns.streamlit_stream_pdf_to_speech_clone(
+            uploaded_pdf, uploaded_voice, language, page_start, page_end,
+            clean_voice, reduce_noise, normalize_audio, apply_filters, trim_silence,
+            half_precision=fast_mode,
+            progress_callback=job.set_progress,
+            should_cancel=job.is_cancelled
+        ))
+        st.session_state["clone_job"] = job
+    
+    job = st.session_state.get("clone_job")
+    if job is None:
+        return
+    
+    if not job.done:
+        st.text("Generating cloned speech...")
+        _clone_job_status()
+        return
+    
+    # Show the result once, like the gTTS mode does
+    st.session_state.pop("clone_job")
+    if job.error is None:
+        st.success("✅ Voice cloning completed!")
+        
+        # Serve the finished audio from disk
+        st.audio(job.audio_path, format='audio/wav')
+        
+        # Download button
+        with open(job.audio_path, 'rb') as audio_file:
+            st.download_button(
+                label="💾 Download Cloned Audio",
+                data=audio_file,
+                file_name=f"cloned_speech_{job.started_at}.wav",
+                mime="audio/wav"
+            )
+    elif job.is_cancelled():
+        st.warning("⏹️ Conversion cancelled")
+    else:
+        st.error(f"❌ Voice cloning failed: {job.error}")
+        st.info("💡 Try uploading a clearer voice sample or check if all dependencies are installed")
+
+
+@st.fragment(run_every=0.5)
+def _clone_job_status():
+    """Poll the running voice cloning job, rerunning the app once it has finished."""
+    job = st.session_state.get("clone_job")
+    if job is None:
+        return
+    if job.done:
+        st.rerun()
+    
+    st.progress(job.progress, text=f"Synthesizing speech... {job.progress:.0%}")
+    
+    if job.preview is not None:
+        # Let the user start listening to the first batch. Later batches
+        # are not re-sent; the full recording replaces this player once
+        # synthesis has finished.
+        st.audio(job.preview, format='audio/wav')
+    
+    # The script is not busy while a job runs, so this click is handled
+    # right away; synthesis stops after the batch in flight
+    st.button("⏹️ Cancel", key="cancel_clone_button", on_click=job.cancel, disabled=job.is_cancelled())
 
 
 def show_requirements():